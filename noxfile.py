@@ -26,6 +26,7 @@ nox.options.sessions = (
     "safety",
     "mypy",
     "tests",
+    "tests-calamine",
     "typeguard",
     "xdoctest",
     "docs-build",
@@ -165,6 +166,16 @@ def tests(session: Session) -> None:
             session.notify("coverage", posargs=[])
 
 
+@session(name="tests-calamine", python="3.11")
+def tests_calamine(session: Session) -> None:
+    """Check the calamine Excel engine reads the sources the same as pandas' defaults."""
+    session.install(".[calamine]")
+    session.install("pytest")
+    # The locked pandas predates calamine support, so step outside the lock for this one
+    session.run("python", "-m", "pip", "install", "pandas>=2.2", "python-calamine")
+    session.run("pytest", "tests", "-k", "calamine", *session.posargs)
+
+
 @session
 def coverage(session: Session) -> None:
     """Produce the coverage report."""
@@ -12,6 +12,9 @@ from .. import always
 from .. import dict_concat_safe
 from ..utils.web import download_extract_zip
 
+# Only the links are of interest on the download page, so don't build the rest of the tree
+_LINKS_ONLY = bs4.SoupStrainer("a", href=True)
+
 
 def get_basic_company_data_url() -> Text:
     """
@@ -20,7 +23,11 @@ def get_basic_company_data_url() -> Text:
     Currently uses the 'one file' method but it could be split into the multi files for memory efficiency
     """
     base_url = "http://download.companieshouse.gov.uk/en_output.html"
-    s = bs4.BeautifulSoup(requests.get(base_url).content)
+    s = bs4.BeautifulSoup(
+        requests.get(base_url, timeout=30).content,
+        features="lxml",
+        parse_only=_LINKS_ONLY,
+    )
     for a in s.find_all("a"):
         if a.get("href").startswith("BasicCompanyDataAsOneFile"):
             url = f"http://download.companieshouse.gov.uk/{a.get('href')}"
@@ -25,6 +25,7 @@ import pandas as pd
 import requests
 from bs4 import BeautifulSoup
 
+from bolster import poolmap
 from bolster.utils.web import get_excel_dataframe
 from bolster.utils.web import ua
 
@@ -34,6 +35,13 @@ _headers = {
     f"like Gecko) Chrome/91.0.4472.114 Safari/537.36"
 }
 _base_url = "https://www.eoni.org.uk"
+_stage_n_catcher = re.compile(r"^Stage (\d+)")
+_results_listing_dir = "/Elections/Election-results-and-statistics/Election-results-and-statistics-2003-onwards/"
+_results_listing_path = {
+    2022: "Elections-2022/NI-Assembly-Election-2022-Result-Sheets",
+    2017: "Elections-2017/NI-Assembly-Election-2017-Result-Sheets",
+    2016: "Elections-2016/NI-Assembly-Election-2016-Candidates-Elected-(1)",
+}
 
 
 def get_page(path: AnyStr) -> BeautifulSoup:
@@ -48,9 +56,9 @@ def get_page(path: AnyStr) -> BeautifulSoup:
     'The Electoral Office of Northern Ireland - EONI'
 
     """
-    res = requests.get(_base_url + path, headers=_headers)
+    res = requests.get(_base_url + path, headers=_headers, timeout=30)
     res.raise_for_status()
-    page = BeautifulSoup(res.content, features="html.parser")
+    page = BeautifulSoup(res.content, features="lxml")
     return page
 
 
@@ -108,10 +116,8 @@ def get_metadata_from_df(
             'electoral_quota': int
     """
 
-    stage_n_catcher = re.compile(r"^Stage (\d+)")
-
     metadata = {
-        "stage": int(re.match(stage_n_catcher, df.columns[5]).group(1)),
+        "stage": int(_stage_n_catcher.match(df.columns[5]).group(1)),
         # should have been just int(df.columns[5].split()[-1])., but someone insisted on messing up 2017
         "date": df.columns[10],
         "constituency": normalise_constituencies(df.iloc[0, 3]),
@@ -134,11 +140,16 @@ def get_candidates_from_df(df: pd.DataFrame) -> pd.DataFrame:
     return candidates_df.replace(0, None).dropna().reset_index(drop=True)
 
 
-def get_stage_votes_from_df(df: pd.DataFrame) -> pd.DataFrame:
+def get_stage_votes_from_df(
+    df: pd.DataFrame, stages: Optional[int] = None
+) -> pd.DataFrame:
     """
     Extract the votes from each stage as a mapped column for each stage, i.e. stages 1...N
+
+    If `stages` isn't given, it's read from the sheet metadata
     """
-    stages = get_metadata_from_df(df)["stage"]
+    if stages is None:
+        stages = get_metadata_from_df(df)["stage"]
     stage_df = (
         pd.concat({n: extract_stage_n_votes(df, n) for n in range(stages)})
         .unstack()
@@ -148,11 +159,16 @@ def get_stage_votes_from_df(df: pd.DataFrame) -> pd.DataFrame:
     return stage_df
 
 
-def get_stage_transfers_from_df(df):
+def get_stage_transfers_from_df(
+    df: pd.DataFrame, stages: Optional[int] = None
+) -> pd.DataFrame:
     """
     Extract the transfers from each stage as a mapped column for each stage, i.e. stages 2...N
+
+    If `stages` isn't given, it's read from the sheet metadata
     """
-    stages = get_metadata_from_df(df)["stage"]
+    if stages is None:
+        stages = get_metadata_from_df(df)["stage"]
     stage_df = (
         pd.concat({n: extract_stage_n_transfers(df, n) for n in range(stages)})
         .unstack()
@@ -203,8 +219,9 @@ def get_results_from_sheet(sheet_url: AnyStr) -> Dict[str, Union[pd.DataFrame, d
     df = get_excel_dataframe(sheet_url, requests_kwargs={"headers": _headers})
     metadata = get_metadata_from_df(df)
     candidates = get_candidates_from_df(df)
-    stage_votes = get_stage_votes_from_df(df)
-    stage_transfers = get_stage_transfers_from_df(df)
+    # Metadata is already parsed, so don't make the stage extractors re-parse it
+    stage_votes = get_stage_votes_from_df(df, stages=metadata["stage"])
+    stage_transfers = get_stage_transfers_from_df(df, stages=metadata["stage"])
 
     return {
         "candidates": candidates,
@@ -215,16 +232,12 @@ def get_results_from_sheet(sheet_url: AnyStr) -> Dict[str, Union[pd.DataFrame, d
 
 
 def get_results(year: int) -> Dict[str, Union[pd.DataFrame, dict]]:
-    results_listing_dir = "/Elections/Election-results-and-statistics/Election-results-and-statistics-2003-onwards/"
-    results_listing_path = {
-        2022: "Elections-2022/NI-Assembly-Election-2022-Result-Sheets",
-        2017: "Elections-2017/NI-Assembly-Election-2017-Result-Sheets",
-        2016: "Elections-2016/NI-Assembly-Election-2016-Candidates-Elected-(1)",
-    }
-
     results = {}
-    results_listing_page = get_page(results_listing_dir + results_listing_path[year])
-    for sheet_url in find_xls_links_in_page(results_listing_page):
-        data = get_results_from_sheet(sheet_url)
+    results_listing_page = get_page(_results_listing_dir + _results_listing_path[year])
+    sheet_urls = list(find_xls_links_in_page(results_listing_page))
+    # Sheets are independent, so fetch/parse them concurrently (but gently; EONI is touchy about scrapers)
+    sheet_results = poolmap(get_results_from_sheet, sheet_urls, max_workers=4)
+    for sheet_url in sheet_urls:
+        data = sheet_results[sheet_url]
         results[data["metadata"]["constituency"]] = data
     return results
@@ -14,18 +14,70 @@ Generic problems fixed;
 
 
 """
+import html
 import re
+import time
+from functools import lru_cache
 from functools import partial
 from typing import Dict
 from typing import Text
 
-import bs4
+import numpy as np
 import pandas as pd
 import requests
 
 DEFAULT_URL = "https://www.finance-ni.gov.uk/publications/ni-house-price-index-statistical-reports"
 TABLE_TRANSFORMATION_MAP = {}
 
+# We only ever want the hrefs of the xlsx links (<a> tags only) on the listing page, so don't bother building a DOM for it
+_XLSX_HREF_RE = re.compile(
+    rb"""<a\s(?:[^>]*?\s)?href\s*=\s*["']([^"'>]+\.xlsx)["']""", re.IGNORECASE
+)
+# 'Quarter 1' style labels, to be munged to 'Q1'
+_QUARTER_LABEL_RE = re.compile("Quarter ([1-4])")
+# 'Q1 2020' style merged Sale Year/Quarter labels
+_QUARTER_YEAR_RE = re.compile("(Q[1-4]) ([0-9]{4})")
+
+
+@lru_cache(maxsize=8)
+def _scrape_source_url(base_url: Text, ttl_bucket: int) -> Text:
+    """
+    Scrape the NI House Price Index Excel link from the finance-ni.gov.uk listing
+
+    `ttl_bucket` isn't used in the scrape; it's only there to key the cache so that results expire
+    (see `get_source_url`)
+    """
+    base_content = requests.get(base_url, timeout=30).content
+    source_url = None
+    # Last xlsx link on the listing wins
+    for href in _XLSX_HREF_RE.findall(base_content):
+        source_url = html.unescape(href.decode())
+
+    if source_url is None:
+        raise RuntimeError(
+            f"Could not find valid/relevant Excel source file on {base_url}"
+        )
+
+    return source_url
+
+
+def get_source_url(base_url=DEFAULT_URL) -> Text:
+    """
+    Find the NI House Price Index Excel link on the finance-ni.gov.uk listing
+
+    The listing only changes when a new report is published, so lookups are cached for up to an hour
+
+    Parameters
+    ----------
+    base_url
+
+    Returns
+    -------
+    URL of the (last listed) xlsx file
+
+    """
+    return _scrape_source_url(base_url, int(time.time() // 3600))
+
 
 def pull_source(base_url=DEFAULT_URL) -> Dict[Text, pd.DataFrame]:
     """
@@ -39,19 +91,8 @@ def pull_source(base_url=DEFAULT_URL) -> Dict[Text, pd.DataFrame]:
     -------
 
     """
-    base_content = requests.get(base_url).content
-    base_soup = bs4.BeautifulSoup(base_content, features="html.parser")
-    source_url = None
-    for a in base_soup.find_all("a"):
-        if a.attrs.get("href", "").lower().endswith("xlsx"):
-            source_url = a.attrs["href"]
-
-    if source_url is not None:
-        source_df = pd.read_excel(source_url, sheet_name=None)  # Load all worksheets in
-    else:
-        raise RuntimeError(
-            f"Could not find valid/relevant Excel source file on {base_url}"
-        )
+    source_url = get_source_url(base_url)
+    source_df = pd.read_excel(source_url, sheet_name=None)  # Load all worksheets in
 
     return source_df
 
@@ -93,16 +134,21 @@ def basic_cleanup(df: pd.DataFrame, offset=1) -> pd.DataFrame:
     # (Note, need to change this 'if' logic to just 'if there's a
     # column with all 100's, but cross that bridge later)
     if "NI" in df:
+        # Gaps (e.g. trailing note rows) are ignored, but there must be something left and it must all be
+        # 100 (give or take float rounding in the spreadsheet)
+        ni = df["NI"].to_numpy(dtype=float)
+        ni = ni[~np.isnan(ni)]
         assert (
-            df["NI"].all() and df["NI"].mean() == 100
+            ni.size and np.isclose(ni, 100).all()
         ), "Not all values in df['NI'] == 100"
         df = df.drop("NI", axis=1)
 
     # Strip rows below the first all-nan row, if there is one
     # (Otherwise this truncates the tables as there is no
     # idxmax in the table of all 'false's)
-    if any(df.isna().all(axis=1)):
-        idx_first_bad_row = df.isna().all(axis=1).idxmax()
+    all_nan_rows = df.isna().all(axis=1)
+    if all_nan_rows.any():
+        idx_first_bad_row = all_nan_rows.idxmax()
         df = df.loc[: idx_first_bad_row - 1]
 
     # By Inspection, other tables use 'Sale Year' and 'Sale Quarter'
@@ -121,7 +167,7 @@ def basic_cleanup(df: pd.DataFrame, offset=1) -> pd.DataFrame:
             loc=0,
             column="Period",
             value=pd.PeriodIndex(
-                df.apply(lambda r: f"{r.Year}-{r.Quarter}", axis=1), freq="Q"
+                df["Year"].astype(str) + "-" + df["Quarter"].astype(str), freq="Q"
             ),
         )
 
@@ -147,7 +193,8 @@ def cleanup_contents(df: pd.DataFrame) -> pd.DataFrame:
 
     """
     new_header = df.iloc[0]
-    df = df[1:].copy()
+    # No copy needed; relabelling columns leaves the source alone and the filter below builds a new frame
+    df = df[1:]
     df.columns = [*new_header[:-1], "Title"]
     # df['Worksheet Name'] = df['Worksheet Name'].str.replace('Figure', 'Fig')
     df = df[df["Worksheet Name"].str.startswith("Table")]
@@ -242,7 +289,7 @@ def cleanup_with_munged_quarters_and_total_rows(
 
     """
     df = df.copy()
-    df.iloc[:, 1] = df.iloc[:, 1].str.replace("Quarter ([1-4])", r"Q\1", regex=True)
+    df.iloc[:, 1] = df.iloc[:, 1].str.replace(_QUARTER_LABEL_RE, r"Q\1", regex=True)
     df = df[~df.iloc[:, 1].str.contains("Total").fillna(False)]
     # Lose the year new-lines (needs astype because non str lines are
     # correctly inferred to be ints, so .str methods nan-out
@@ -306,7 +353,7 @@ def cleanup_merged_year_quarters_and_totals(df):
     # Extract 'Quarter' and 'Year' columns from the future 'Sale Year/Quarter' column
     dates = (
         df.iloc[:, 0]
-        .str.extract("(Q[1-4]) ([0-9]{4})")
+        .str.extract(_QUARTER_YEAR_RE)
         .rename(columns={0: "Quarter", 1: "Year"})
     )
     for c in [
@@ -14,6 +14,7 @@ import requests
 from lxml.etree import XMLSyntaxError
 
 from bolster import backoff
+from bolster import poolmap
 
 
 POSTCODE_DATASET_URL = "https://admin.opendatani.gov.uk/dataset/38a9a8f1-9346-41a2-8e5f-944d87d9caf2/resource/f2bc12c1-4277-4db5-8bd3-b7bb027cc401/download/postcode-v-zone-lookup-by-year.csv"
@@ -118,12 +119,11 @@ def get_water_quality() -> pd.DataFrame:
     """
     supply_zones = set(get_postcode_to_water_supply_zone().values())
 
-    df = pd.DataFrame(
-        [
-            get_water_quality_by_zone(zone_code)
-            for zone_code in supply_zones
-            if zone_code != "#N/A"
-        ]
-    )
+    zones = sorted(zone_code for zone_code in supply_zones if zone_code != "#N/A")
+
+    # Each zone is a separate lookup, so run them concurrently (NI Water is prone to 503s, so not too many)
+    zone_data = poolmap(get_water_quality_by_zone, zones, max_workers=4)
+    # poolmap hands results back in completion order, so rebuild in zone order
+    df = pd.DataFrame([zone_data[zone_code] for zone_code in zones])
     df = df.astype({"NI Hardness Classification": T_HARDNESS})
     return df
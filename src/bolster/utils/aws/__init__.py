@@ -298,15 +298,14 @@ def get_latest_key(
     if client is None:
         client = get_s3_client()
 
-    versions = sorted(
-        [
+    # Only the highest key is wanted, so there's no need to sort the whole listing
+    latest = max(
+        (
             v["Key"]
             for v in client.list_objects_v2(Bucket=bucket, Prefix=prefix)["Contents"]
-        ],
+        ),
         key=key,
-        reverse=True,
     )
-    latest = versions[0]
     return latest
 
 
@@ -1,10 +1,14 @@
-import io
 import logging
+import os
+import tempfile
 import zipfile
 from io import BytesIO
+from typing import Optional
 
 import pandas as pd
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from waybackpy import exceptions
 from waybackpy import WaybackMachineCDXServerAPI
 
@@ -14,6 +18,48 @@ ua = f"@Bolster/{version_no} (+http://bolster.online/)"
 
 session = requests.Session()
 session.headers.update({"User-Agent": ua})
+# Keep connections alive between calls and ride out transient server errors/rate-limiting;
+# `raise_on_status=False` hands the last response back so `raise_for_status` still raises a `HTTPError`
+_adapter = HTTPAdapter(
+    pool_connections=10,
+    pool_maxsize=20,
+    max_retries=Retry(
+        total=3,
+        backoff_factor=1,
+        status_forcelist=[429, 500, 502, 503, 504],
+        raise_on_status=False,
+    ),
+)
+session.mount("https://", _adapter)
+session.mount("http://", _adapter)
+
+
+def _calamine_available() -> bool:
+    """
+    Whether the Rust-backed `calamine` Excel engine can be used, i.e. `python-calamine` is installed
+    (the `calamine` extra, `pip install bolster[calamine]`) and pandas is new enough (>=2.2) to use it
+    """
+    try:
+        import python_calamine  # noqa: F401
+    except ImportError:
+        return False
+    return tuple(int(v) for v in pd.__version__.split(".")[:2]) >= (2, 2)
+
+
+def _default_excel_engine() -> Optional[str]:
+    """
+    Excel engine to hand to `pd.read_excel`; by default this is None, leaving it to pandas to choose
+    (`xlrd` for `.xls`, `openpyxl` for `.xlsx`).
+
+    Set `BOLSTER_EXCEL_ENGINE` (e.g. to `calamine`) to opt in to something else. Having calamine installed
+    isn't enough on its own, as downstream parsers index into sheets positionally (e.g. the EONI result
+    sheets and the NI HPI workbook) and have only been checked against the default engines;
+    the `tests-calamine` nox session checks that calamine agrees with them.
+    """
+    return os.environ.get("BOLSTER_EXCEL_ENGINE") or None
+
+
+EXCEL_ENGINE = _default_excel_engine()
 
 
 def get_last_valid(url):
@@ -27,14 +73,14 @@ def resilient_get(url, **kwargs):
     """
 
     try:
-        res = requests.get(url, **kwargs)
+        res = session.get(url, **kwargs)
         res.raise_for_status()
     except requests.HTTPError as outer_err:
         try:
             last_valid = get_last_valid(url)
         except exceptions.NoCDXRecordFound as inner_err:
             raise outer_err from inner_err
-        res = requests.get(last_valid, **kwargs)
+        res = session.get(last_valid, **kwargs)
         res.raise_for_status()
         logging.warning(
             f"Failed to get {url} directly, successfully used waybackmachine to get {last_valid}"
@@ -47,8 +93,9 @@ def get_excel_dataframe(file_url, requests_kwargs=None, read_kwargs=None):
         requests_kwargs = {}
     if read_kwargs is None:
         read_kwargs = {}
+    read_kwargs = {"engine": EXCEL_ENGINE, **read_kwargs}
 
-    with requests.get(file_url, **requests_kwargs) as response:
+    with session.get(file_url, **requests_kwargs) as response:
         response.raise_for_status()
         data = BytesIO(response.content)
         df = pd.read_excel(data, **read_kwargs)
@@ -62,7 +109,12 @@ def download_extract_zip(url):
     """
     with session.get(url, stream=True) as response:
         response.raise_for_status()
-        with zipfile.ZipFile(io.BytesIO(response.content)) as thezip:
-            for zipinfo in thezip.infolist():
-                with thezip.open(zipinfo) as thefile:
-                    yield zipinfo.filename, thefile
+        # Spool the archive to disk as it arrives rather than holding the whole thing in memory
+        with tempfile.TemporaryFile() as spool:
+            for chunk in response.iter_content(chunk_size=1 << 20):
+                spool.write(chunk)
+            spool.seek(0)
+            with zipfile.ZipFile(spool) as thezip:
+                for zipinfo in thezip.infolist():
+                    with thezip.open(zipinfo) as thefile:
+                        yield zipinfo.filename, thefile
@@ -1,9 +1,14 @@
 import datetime
 import unittest
 
+import pandas as pd
+
 from bolster.data_sources.eoni import _headers
 from bolster.data_sources.eoni import get_results
 from bolster.data_sources.eoni import get_results_from_sheet
+from bolster.data_sources.eoni import get_stage_transfers_from_df
+from bolster.data_sources.eoni import get_stage_votes_from_df
+from bolster.utils.web import _calamine_available
 from bolster.utils.web import get_excel_dataframe
 
 constituencies_post_2003 = {
@@ -34,6 +39,24 @@ class MyTestCase(unittest.TestCase):
         df = get_excel_dataframe(test_url, requests_kwargs={"headers": _headers})
         self.assertEqual(df.shape, (231, 110))
 
+    @unittest.skipUnless(
+        _calamine_available(), reason="calamine extra (and pandas>=2.2) not installed"
+    )
+    def test_sheet_read_calamine_matches_xlrd(self):
+        # The parsers index into these sheets by position, so the engines have to agree exactly
+        test_url = "https://www.eoni.org.uk/getmedia/c537e56f-c319-47d1-a2b0-44c90f9aa170/NI-Assembly-Election-2022-Result-Sheet-Belfast-East-XLS"
+        df = get_excel_dataframe(
+            test_url,
+            requests_kwargs={"headers": _headers},
+            read_kwargs={"engine": "calamine"},
+        )
+        expected = get_excel_dataframe(
+            test_url,
+            requests_kwargs={"headers": _headers},
+            read_kwargs={"engine": "xlrd"},
+        )
+        pd.testing.assert_frame_equal(df, expected)
+
     def test_sheet_metadata(self):
         test_url = "https://www.eoni.org.uk/getmedia/c537e56f-c319-47d1-a2b0-44c90f9aa170/NI-Assembly-Election-2022-Result-Sheet-Belfast-East-XLS"
         test_metadata = {
@@ -76,5 +99,38 @@ class MyTestCase(unittest.TestCase):
         self.assertSetEqual(set(data.keys()), constituencies_post_2003)
 
 
+class StagesTestCase(unittest.TestCase):
+    """Offline checks against a small frame laid out like a result sheet"""
+
+    stages = 4
+
+    def setUp(self) -> None:
+        columns = [f"Unnamed: {i}" for i in range(14)]
+        columns[5] = f"Stage {self.stages}"
+        columns[10] = datetime.datetime(2022, 5, 5)
+        self.df = pd.DataFrame(0, index=range(30), columns=columns, dtype=object)
+        self.df.iloc[0, 3] = "Belfast East"
+        for row, col in [(1, 3), (2, 3), (1, 6), (2, 6), (1, 9), (1, 12)]:
+            self.df.iloc[row, col] = 1000 + row * 100 + col
+        # Five candidates with votes/transfers across the stage columns, the rest left as 0
+        for row in range(9, 14):
+            for col in range(4, 4 + 2 * self.stages):
+                self.df.iloc[row, col] = row * 10 + col
+
+    def test_stage_votes_explicit_stages_match_metadata(self):
+        from_metadata = get_stage_votes_from_df(self.df)
+        self.assertEqual(from_metadata.shape, (5, self.stages - 1))
+        pd.testing.assert_frame_equal(
+            get_stage_votes_from_df(self.df, stages=self.stages), from_metadata
+        )
+
+    def test_stage_transfers_explicit_stages_match_metadata(self):
+        from_metadata = get_stage_transfers_from_df(self.df)
+        self.assertEqual(from_metadata.shape, (5, self.stages - 2))
+        pd.testing.assert_frame_equal(
+            get_stage_transfers_from_df(self.df, stages=self.stages), from_metadata
+        )
+
+
 if __name__ == "__main__":
     unittest.main()
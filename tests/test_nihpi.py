@@ -1,8 +1,11 @@
 import unittest
+from unittest import mock
 
+import pandas as pd
 import requests_cache
 
 from bolster.data_sources import ni_house_price_index as hpi
+from bolster.utils.web import _calamine_available
 
 
 class MyTestCase(unittest.TestCase):
@@ -14,6 +17,19 @@ class MyTestCase(unittest.TestCase):
         dfs = hpi.pull_source()
         self.assertEqual(len(dfs), 36)  # Source has changed size, should be 36 long!
 
+    @unittest.skipUnless(
+        _calamine_available(), reason="calamine extra (and pandas>=2.2) not installed"
+    )
+    def test_source_calamine_matches_openpyxl(self):
+        # Sheets are picked apart positionally, so the engines have to agree exactly
+        source_url = hpi.get_source_url()
+        dfs = pd.read_excel(source_url, sheet_name=None, engine="calamine")
+        expected = pd.read_excel(source_url, sheet_name=None, engine="openpyxl")
+        self.assertEqual(list(dfs), list(expected))
+        for sheet, df in dfs.items():
+            with self.subTest(sheet=sheet):
+                pd.testing.assert_frame_equal(df, expected[sheet])
+
     def test_output_size(self):
         dfs = hpi.build()
         self.assertEqual(len(dfs), 33)  # Final has changed size, should be 33
@@ -24,5 +40,80 @@ class MyTestCase(unittest.TestCase):
         requests_cache.uninstall_cache()
 
 
+class SourceUrlTestCase(unittest.TestCase):
+    listing = b"""
+    <html><head>
+    <link rel="alternate" href="/files/feed.xlsx">
+    </head><body>
+    <a class="file" href="https://example.com/files/old-report.xlsx">Old report</a>
+    <a href = 'https://example.com/files/hpi&amp;report.XLSX'>Latest report</a>
+    <a href="https://example.com/files/report.pdf">PDF</a>
+    <div data-href="/files/not-a-link.xlsx"></div>
+    <area href="/files/map.xlsx">
+    </body></html>
+    """
+
+    def setUp(self) -> None:
+        hpi._scrape_source_url.cache_clear()
+
+    def tearDown(self) -> None:
+        hpi._scrape_source_url.cache_clear()
+
+    def _get(self, content):
+        return mock.patch.object(
+            hpi.requests, "get", return_value=mock.Mock(content=content)
+        )
+
+    def test_last_anchor_xlsx_wins(self):
+        with self._get(self.listing):
+            url = hpi.get_source_url("https://example.com/listing")
+        self.assertEqual(url, "https://example.com/files/hpi&report.XLSX")
+
+    def test_lookup_is_cached(self):
+        with self._get(self.listing) as get:
+            hpi.get_source_url("https://example.com/listing")
+            hpi.get_source_url("https://example.com/listing")
+        self.assertEqual(get.call_count, 1)
+
+    def test_no_link_raises(self):
+        with self._get(b'<html><link href="/files/feed.xlsx"></html>'):
+            with self.assertRaises(RuntimeError):
+                hpi.get_source_url("https://example.com/listing")
+
+
+class BasicCleanupTestCase(unittest.TestCase):
+    """Offline checks on the hidden 'NI' checksum column"""
+
+    def _sheet(self, ni):
+        rows = [["Table 1", None, None, None], ["Year", "Quarter", "NI", "Index"]]
+        rows += [
+            [2005 + i // 4, f"Q{i % 4 + 1}", value, 100 + i]
+            for i, value in enumerate(ni)
+        ]
+        return pd.DataFrame(rows)
+
+    def test_all_100_is_dropped(self):
+        df = hpi.basic_cleanup(self._sheet([100, 100, 100]))
+        self.assertNotIn("NI", df)
+        self.assertEqual(len(df), 3)
+
+    def test_gaps_are_ignored(self):
+        df = hpi.basic_cleanup(self._sheet([100, None, 100]))
+        self.assertNotIn("NI", df)
+        self.assertEqual(len(df), 3)
+
+    def test_float_rounded_100_is_accepted(self):
+        df = hpi.basic_cleanup(self._sheet([100.0, 100.0, (0.7 + 0.1) * 125]))
+        self.assertNotIn("NI", df)
+
+    def test_all_nan_raises(self):
+        with self.assertRaises(AssertionError):
+            hpi.basic_cleanup(self._sheet([None, None, None]))
+
+    def test_not_100_raises(self):
+        with self.assertRaises(AssertionError):
+            hpi.basic_cleanup(self._sheet([100, 90, 110]))
+
+
 if __name__ == "__main__":
     unittest.main()